@@ -1,15 +1,24 @@
 import os
 import sys
-import subprocess
-from typing import List
+from typing import List, Optional
 
 from apps.config.ui import UI
 
+# main.py written into new sample apps; %s is replaced with the app name
+_SAMPLE_TEMPLATE = (
+    b'def main():\n'
+    b'    print("Hello from %s!")\n\n'
+    b'if __name__ == "__main__":\n'
+    b'    main()\n'
+)
+
 class AppManager:
     """Class for managing apps in the config tool."""
 
     def __init__(self, apps_dir: str):
         self.apps_dir = apps_dir
+        # (st_mtime_ns, apps) of the last apps_dir scan
+        self._list_cache = (None, None)
         self._ensure_apps_dir()
 
     def _ensure_apps_dir(self) -> None:
@@ -21,48 +30,64 @@ class AppManager:
                 UI.show_error(f"Creating apps directory: {e}")
 
     def list_apps(self) -> List[str]:
-        if not os.path.exists(self.apps_dir):
+        try:
+            # A directory's mtime changes whenever entries are added or removed,
+            # so an unchanged mtime means the previous scan is still valid
+            mtime = os.stat(self.apps_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            UI.show_error(f"Listing apps: {e}")
             return []
+        if self._list_cache[0] == mtime:
+            return self._list_cache[1]
         try:
-            # List directories in apps_dir, excluding 'config'
-            all_dirs = [d for d in os.listdir(self.apps_dir)
-                        if os.path.isdir(os.path.join(self.apps_dir, d)) and d != "config"]
-            # Only consider directories with bracketed names and sort for consistency
-            app_dirs = sorted(d for d in all_dirs if d.startswith('[') and d.endswith(']'))
+            # Only consider bracketed directories (excluding 'config'); the name
+            # check runs first so is_dir() can use the cached dirent type
+            with os.scandir(self.apps_dir) as entries:
+                app_dirs = sorted(e.name for e in entries
+                                  if e.name[:1] == '[' and e.name[-1:] == ']'
+                                  and e.name != "config" and e.is_dir())
             # Strip brackets
-            return [d[1:-1] for d in app_dirs]
+            apps = [d[1:-1] for d in app_dirs]
+            self._list_cache = (mtime, apps)
+            return apps
         except OSError as e:
             UI.show_error(f"Listing apps: {e}")
             return []
 
-    def run_app(self, app_name: str) -> None:
-        dir_name = f"[{app_name}]"
-        app_dir = os.path.join(self.apps_dir, dir_name)
+    def run_app(self, app_name: str, base_dir: Optional[str] = None) -> None:
+        base_dir = base_dir or self.apps_dir
+        app_dir = os.path.join(base_dir, f"[{app_name}]")
         app_path = os.path.join(app_dir, "main.py")
 
-        # Check for sub-apps
+        # Check for main.py and sub-apps in a single pass over the app directory
+        main_py_exists = False
         sub_apps = []
         try:
-            for item in os.listdir(app_dir):
-                item_path = os.path.join(app_dir, item)
-                if os.path.isdir(item_path) and item.startswith('[') and item.endswith(']'):
-                    sub_apps.append(item[1:-1])
+            with os.scandir(app_dir) as entries:
+                for entry in entries:
+                    if entry.name == "main.py" and entry.is_file():
+                        main_py_exists = True
+                    elif entry.name[:1] == '[' and entry.name[-1:] == ']' and entry.is_dir():
+                        sub_apps.append(entry.name[1:-1])
         except OSError:
             sub_apps = []
 
         if sub_apps:
-            while True:
-                content = [f"App: {app_name}", UI.Style.SEPARATOR_MARKER]
-                if os.path.exists(app_path):
-                    content.append("1. Run this app")
-                    content.append(UI.Style.SEPARATOR_MARKER)
-                offset = 2 if os.path.exists(app_path) else 1
-                for i, sub_app in enumerate(sub_apps, offset):
-                    content.append(f"{i}. {sub_app}")
+            # The menu does not change between redraws, so build it once
+            content = [f"App: {app_name}", UI.Style.SEPARATOR_MARKER]
+            if main_py_exists:
+                content.append("1. Run this app")
                 content.append(UI.Style.SEPARATOR_MARKER)
-                content.append("b. Back to main menu")
-                content.append("q. Quit")
+            offset = 2 if main_py_exists else 1
+            for i, sub_app in enumerate(sub_apps, offset):
+                content.append(f"{i}. {sub_app}")
+            content.append(UI.Style.SEPARATOR_MARKER)
+            content.append("b. Back to main menu")
+            content.append("q. Quit")
 
+            while True:
                 UI.draw_box(content, center_title=True, title_color=UI.Color.YELLOW)
                 choice = UI.get_input(prompt="Select an option: ")
 
@@ -70,29 +95,28 @@ class AppManager:
                     return
                 elif choice == "q":
                     sys.exit(0)
-                elif choice == "1" and os.path.exists(app_path):
+                elif choice == "1" and main_py_exists:
                     break
                 elif choice.isdigit():
                     index = int(choice) - offset
                     if 0 <= index < len(sub_apps):
-                        original_apps_dir = self.apps_dir
-                        try:
-                            self.apps_dir = os.path.join(self.apps_dir, dir_name)
-                            self.run_app(sub_apps[index])
-                        finally:
-                            self.apps_dir = original_apps_dir
+                        self.run_app(sub_apps[index], base_dir=app_dir)
                         return
                     else:
                         UI.show_error("Invalid sub-app number.")
                 else:
                     UI.show_error("Invalid choice.")
 
-        if not os.path.exists(app_path):
+        if not main_py_exists:
             UI.show_error(f"App '{app_name}' does not have a main.py file.")
             return
 
+        # Imported here so commands that never launch an app don't pay for it
+        import subprocess
         try:
             UI.show_message(f"Running app: {app_name}", color=UI.Color.CYAN)
+            # Keep this call on CPython's fast spawn paths (vfork/posix_spawn): an absolute
+            # executable and no cwd/preexec_fn/pass_fds/start_new_session/user options
             result = subprocess.run([sys.executable, app_path], capture_output=True, text=True, check=True)
             if result.stdout:
                 UI.show_message(f"App Output:\n{result.stdout}", color=UI.Color.GREEN)
@@ -108,7 +132,8 @@ class AppManager:
     def create_sample_app(self, app_name: str) -> None:
         folder_name = f"[{app_name}]"
         app_path = os.path.join(self.apps_dir, folder_name)
-        if os.path.exists(app_path):
+        # lexists also reports dangling symlinks, which would make makedirs fail
+        if os.path.lexists(app_path):
             UI.show_error(f"App '{app_name}' already exists.")
             return
         try:
@@ -119,11 +144,5 @@ class AppManager:
             UI.show_error(f"Creating app: {e}")
 
     def _create_main_py(self, app_path: str, app_name: str) -> None:
-        sample_code = (
-            f'def main():\n'
-            f'    print("Hello from {app_name}!")\n\n'
-            f'if __name__ == "__main__":\n'
-            f'    main()\n'
-        )
-        with open(os.path.join(app_path, "main.py"), "w") as f:
-            f.write(sample_code)
\ No newline at end of file
+        with open(os.path.join(app_path, "main.py"), "wb", buffering=0) as f:
+            f.write(_SAMPLE_TEMPLATE % app_name.encode())
\ No newline at end of file
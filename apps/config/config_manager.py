@@ -1,35 +1,76 @@
+import functools
 import os
-import platform
+import re
 import sys
-from pathlib import Path
 from apps.config.ui import UI
 
+# The platform cannot change while the tool is running; sys.platform avoids
+# importing the platform module just for these checks
+_IS_WINDOWS = sys.platform == "win32"
+_IS_DARWIN = sys.platform == "darwin"
+
+# Config file path -> ((st_mtime_ns, st_size), alias present) from the last read
+_alias_cache = {}
+
+
+def _marker_line_re(marker: str) -> "re.Pattern[bytes]":
+    """Match a marker only as a whole line: surrounding blanks allowed, LF or CRLF ending."""
+    return re.compile(rb"^[ \t]*" + re.escape(marker.rstrip("\n").encode()) + rb"[ \t]*(?:\r?\n|\Z)",
+                      re.MULTILINE)
+
+
 class ConfigManager:
     """Class for managing shell configuration and aliases."""
 
     # Alias markers
     MARKER_START = "# Dagger tool alias - do not edit\n"
     MARKER_END = "# End dagger tool alias\n"
+    # Whole-line marker patterns shared by is_alias_set and remove_alias
+    _MARKER_START_RE = _marker_line_re(MARKER_START)
+    _MARKER_END_RE = _marker_line_re(MARKER_END)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_shell_config_file() -> str:
         """
         Determine the shell configuration file based on the platform.
 
+        The result is cached since the platform, home directory and shell
+        do not change while the tool is running.
+
         Returns:
             Path to the shell configuration file.
         """
         home_dir = os.path.expanduser("~")
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             return os.path.join(home_dir, "Documents", "WindowsPowerShell", "Microsoft.PowerShell_profile.ps1")
 
         shell = os.environ.get('SHELL', '').split('/')[-1]
         if shell == "zsh":
             return os.path.join(home_dir, ".zshrc")
-        elif platform.system() == "Darwin":
+        elif _IS_DARWIN:
             return os.path.join(home_dir, ".bash_profile")
         return os.path.join(home_dir, ".bashrc")
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_alias_line() -> str:
+        """
+        Build the platform-specific 'dagger' alias definition.
+
+        Returns:
+            The alias line, including its trailing newline.
+        """
+        from pathlib import Path
+
+        # Determine path to the main script using pathlib
+        script_path = Path(__file__).resolve().parents[2] / "main.py"
+        # Use the current Python executable for the alias
+        if _IS_WINDOWS:
+            # PowerShell function alias
+            return f"function dagger {{ & '{sys.executable}' '{script_path}' }}\n"
+        return f"alias dagger='{sys.executable} {script_path}'\n"
+
     @classmethod
     def is_alias_set(cls, config_file: str) -> bool:
         """
@@ -41,11 +82,38 @@ class ConfigManager:
         Returns:
             True if alias is set, False otherwise.
         """
-        if not os.path.exists(config_file):
+        try:
+            st = os.stat(config_file)
+        except FileNotFoundError:
             return False
+        except OSError as e:
+            UI.show_error(f"Reading config file: {e}")
+            return False
+        # Only re-read the file when its mtime or size has changed
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _alias_cache.get(config_file)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
         try:
-            with open(config_file, "r") as f:
-                return cls.MARKER_START in f.read()
+            # Scan the raw bytes in large chunks and stop at the first match
+            with open(config_file, "rb", buffering=0) as f:
+                pending = b""
+                while True:
+                    chunk = f.read(131072)
+                    if not chunk:
+                        # Whatever is left is the final line, which may end without a newline
+                        alias_set = cls._MARKER_START_RE.search(pending) is not None
+                        break
+                    data = pending + chunk
+                    # Only search complete lines; the unfinished last line is carried
+                    # over so the pattern never sees a line cut off at a chunk boundary
+                    cut = data.rfind(b"\n") + 1
+                    if cls._MARKER_START_RE.search(data, 0, cut):
+                        alias_set = True
+                        break
+                    pending = data[cut:]
+            _alias_cache[config_file] = (stamp, alias_set)
+            return alias_set
         except IOError as e:
             UI.show_error(f"Reading config file: {e}")
             return False
@@ -54,28 +122,28 @@ class ConfigManager:
     def add_alias(cls) -> None:
         """Add the 'dagger' alias to the shell configuration file."""
         config_file = cls.get_shell_config_file()
-        # Determine path to the main script using pathlib
-        script_path = Path(__file__).resolve().parents[2] / "main.py"
-        # Use the current Python executable for the alias
-        if platform.system() == "Windows":
-            # PowerShell function alias
-            alias_line = f"function dagger {{ & '{sys.executable}' '{script_path}' }}\n"
-        else:
-            alias_line = f"alias dagger='{sys.executable} {script_path}'\n"
 
         if cls.is_alias_set(config_file):
             UI.show_message("Alias 'dagger' is already set.", color=UI.Color.YELLOW)
             return
 
+        import locale
+
+        alias_line = cls.get_alias_line()
         try:
-            if platform.system() == "Windows" and not os.path.exists(os.path.dirname(config_file)):
+            if _IS_WINDOWS and not os.path.exists(os.path.dirname(config_file)):
                 os.makedirs(os.path.dirname(config_file))
 
-            with open(config_file, "a") as f:
-                f.write(f"\n{cls.MARKER_START}{alias_line}{cls.MARKER_END}")
+            # The block is tiny, so write it straight through without a buffer layer.
+            # Encode like text mode did: Windows PowerShell reads BOM-less profiles
+            # in the ANSI code page, so non-ASCII paths must not be written as UTF-8
+            block = f"\n{cls.MARKER_START}{alias_line}{cls.MARKER_END}"
+            with open(config_file, "ab", buffering=0) as f:
+                f.write(block.encode(locale.getpreferredencoding(False)))
+            _alias_cache.pop(config_file, None)
 
             msg = (f"Alias 'dagger' added to {config_file}. Restart your shell or run 'source {config_file}'."
-                   if platform.system() != "Windows" else
+                   if not _IS_WINDOWS else
                    f"Alias 'dagger' added to {config_file}. Restart PowerShell.")
             UI.show_message(msg, color=UI.Color.GREEN)
         except IOError as e:
@@ -90,27 +158,46 @@ class ConfigManager:
             UI.show_message(f"Configuration file {config_file} does not exist.", color=UI.Color.YELLOW)
             return
 
-        try:
-            with open(config_file, "r") as f:
-                lines = f.readlines()
-
-            new_lines = []
-            skip = False
-            for line in lines:
-                if line.strip() == cls.MARKER_START.strip():
-                    skip = True
-                elif line.strip() == cls.MARKER_END.strip():
-                    skip = False
-                    continue
+        if not cls.is_alias_set(config_file):
+            UI.show_message("Alias 'dagger' is not set.", color=UI.Color.YELLOW)
+            return
 
-                if not skip:
-                    new_lines.append(line)
+        from pathlib import Path
 
-            with open(config_file, "w") as f:
-                f.writelines(new_lines)
+        try:
+            # Splice the marked block(s) out of the raw bytes in a single read and write
+            data = Path(config_file).read_bytes()
+            removed = 0
+            match = cls._MARKER_START_RE.search(data)
+            while match:
+                # Matches span whole lines, including any indentation and the line break
+                start = match.start()
+                end_match = cls._MARKER_END_RE.search(data, match.end())
+                # Unterminated block: drop everything after the start marker
+                end = end_match.end() if end_match else len(data)
+                # Also drop the blank line add_alias wrote before the block; the previous
+                # line's own terminator is left alone
+                if data.endswith(b"\r\n", 0, start):
+                    line_break = 2
+                elif data.endswith(b"\n", 0, start):
+                    line_break = 1
+                else:
+                    line_break = 0
+                if line_break and (start == line_break or data.endswith(b"\n", 0, start - line_break)):
+                    start -= line_break
+                data = data[:start] + data[end:]
+                removed += 1
+                match = cls._MARKER_START_RE.search(data, start)
+
+            if not removed:
+                UI.show_message("Alias 'dagger' is not set.", color=UI.Color.YELLOW)
+                return
+
+            Path(config_file).write_bytes(data)
+            _alias_cache.pop(config_file, None)
 
             msg = (f"Alias 'dagger' removed from {config_file}. Restart your shell or run 'source {config_file}'."
-                   if platform.system() != "Windows" else
+                   if not _IS_WINDOWS else
                    f"Alias 'dagger' removed from {config_file}. Restart PowerShell.")
             UI.show_message(msg, color=UI.Color.GREEN)
         except IOError as e:
@@ -1,7 +1,6 @@
+import os
 import sys
-import argparse
 from typing import List
-from pathlib import Path
 
 from apps.config.app_manager import AppManager
 from apps.config.ui import UI
@@ -10,11 +9,14 @@ from apps.config.config_manager import ConfigManager
 class ConfigTool:
     """Main class for the configuration tool."""
 
+    # Fixed end of the main menu; sample app creation and alias management live under Settings
+    _MENU_TAIL = (UI.Style.SEPARATOR_MARKER, "Options:", "s. Settings", "q. Quit")
+
     def __init__(self):
-        # Determine project root and apps directory using pathlib
-        project_root = Path(__file__).resolve().parents[2]
-        apps_dir = project_root / "apps"
-        self.app_manager = AppManager(str(apps_dir))
+        # Determine project root and apps directory (os.path keeps pathlib off the startup path)
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+        apps_dir = os.path.join(project_root, "apps")
+        self.app_manager = AppManager(apps_dir)
 
     def build_menu_content(self, apps: List[str], alias_set: bool) -> List[str]:
         """
@@ -27,28 +29,24 @@ class ConfigTool:
         Returns:
             Lines for the menu, including title and separators.
         """
-        content = ["Dagger", UI.Style.SEPARATOR_MARKER]
-        if apps:
-            content.append("Available Apps:")
-            for i, app in enumerate(apps, 1):
-                content.append(f"{i}. {app}")
-        else:
-            content.append("No apps available yet.")
-        content.append(UI.Style.SEPARATOR_MARKER)
-        content.append("Options:")
-        # Move sample app creation and alias management under Settings
-        content.append("s. Settings")
-        content.append("q. Quit")
+        content = ["Dagger", UI.Style.SEPARATOR_MARKER, "Available Apps:" if apps else "No apps available yet."]
+        content.extend([f"{i}. {app}" for i, app in enumerate(apps, 1)])
+        content.extend(self._MENU_TAIL)
         return content
 
     def main_menu(self) -> None:
         """Display the interactive main menu."""
+        menu_key = None
+        # The shell config path cannot change during a session
+        config_file = ConfigManager.get_shell_config_file()
         try:
             while True:
-                config_file = ConfigManager.get_shell_config_file()
                 alias_set = ConfigManager.is_alias_set(config_file)
                 apps = self.app_manager.list_apps()
-                content = self.build_menu_content(apps, alias_set)
+                # Only rebuild the menu when the apps or alias state changed
+                if menu_key != (tuple(apps), alias_set):
+                    menu_key = (tuple(apps), alias_set)
+                    content = self.build_menu_content(apps, alias_set)
                 UI.draw_box(content, center_title=True, title_color=UI.Color.BLUE)
 
                 choice = UI.get_input(prompt="> ")
@@ -72,10 +70,10 @@ class ConfigTool:
 
     def settings_menu(self) -> None:
         """Display settings menu for alias and sample app management."""
+        config_file = ConfigManager.get_shell_config_file()
         try:
             while True:
                 # Refresh alias state for each display
-                config_file = ConfigManager.get_shell_config_file()
                 alias_set = ConfigManager.is_alias_set(config_file)
                 content = ["Settings", UI.Style.SEPARATOR_MARKER]
                 content.append("Options:")
@@ -110,6 +108,8 @@ class ConfigTool:
         """
         Parse and dispatch command line arguments using argparse.
         """
+        import argparse
+
         parser = argparse.ArgumentParser(prog='dagger',
                                          description='Dagger configuration tool')
         subparsers = parser.add_subparsers(dest='command', help='Available commands')
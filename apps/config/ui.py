@@ -1,6 +1,8 @@
 # ui.py
-from typing import List
+from typing import List, Tuple
+import functools
 import os
+import sys
 
 class UI:
     """Enhanced class for professional UI rendering and interactions."""
@@ -29,10 +31,21 @@ class UI:
         CYAN = '\033[96m'
         GRAY = '\033[90m'
 
+    # Home cursor, clear screen and scrollback (what `clear` emits)
+    _CLEAR_SEQUENCE = '\033[H\033[2J\033[3J'
+    # Windows consoles only interpret ANSI escapes once a child process has enabled it
+    _ansi_ready = os.name != 'nt'
+
     @classmethod
     def clear_screen(cls) -> None:
         """Clear the terminal screen for a fresh display."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if not cls._ansi_ready:
+            # Running cls once also turns on ANSI processing for this console
+            os.system('cls')
+            cls._ansi_ready = True
+            return
+        sys.stdout.write(cls._CLEAR_SEQUENCE)
+        sys.stdout.flush()
 
     @classmethod
     def draw_box(cls, content: List[str], center_title: bool = False, title_color: str = Color.BLUE,
@@ -48,37 +61,55 @@ class UI:
             border_color: ANSI color code for the borders.
         """
         cls.clear_screen()  # Fresh screen for each redraw
-        text_lines = [line for line in content if line != cls.Style.SEPARATOR_MARKER]
-        if not text_lines:
+        separator_marker = cls.Style.SEPARATOR_MARKER
+        max_length = max((len(line) for line in content if line != separator_marker), default=None)
+        if max_length is None:
             return
 
-        max_length = max(len(line) for line in text_lines)
         internal_width = max_length + (2 * cls.Style.PADDING)
-        top_border = f"{border_color}{cls.Style.TOP_LEFT}{cls.Style.HORIZONTAL * internal_width}{cls.Style.TOP_RIGHT}{cls.Color.RESET}"
-        bottom_border = f"{border_color}{cls.Style.BOTTOM_LEFT}{cls.Style.HORIZONTAL * internal_width}{cls.Style.BOTTOM_RIGHT}{cls.Color.RESET}"
-        separator = f"{border_color}{cls.Style.LEFT_T}{cls.Style.HORIZONTAL * internal_width}{cls.Style.RIGHT_T}{cls.Color.RESET}"
+        top_border, bottom_border, separator = cls._make_borders(internal_width, border_color)
 
-        print(top_border)
+        # The colored left/right edges are the same for every line, so build them once
+        left_edge = f"{border_color}{cls.Style.VERTICAL}{cls.Color.RESET}"
+        title_prefix = f"{left_edge}{title_color}{cls.Color.BOLD}"
+        text_prefix = f"{left_edge}{text_color}"
+        suffix = f"{cls.Color.RESET}{border_color}{cls.Style.VERTICAL}{cls.Color.RESET}"
+        padding = ' ' * cls.Style.PADDING
+
+        # Collect all lines and emit them with a single write
+        out = [top_border]
         for i, line in enumerate(content):
-            if line == cls.Style.SEPARATOR_MARKER:
-                print(separator)
+            if line == separator_marker:
+                out.append(separator)
+            elif center_title and i == 0:
+                # Centering across the full width already yields the side padding
+                out.append(title_prefix + line.center(internal_width) + suffix)
             else:
-                padding = ' ' * cls.Style.PADDING
-                if center_title and i == 0:
-                    formatted = f"{padding}{line}{padding}".center(internal_width)
-                    print(
-                        f"{border_color}{cls.Style.VERTICAL}{cls.Color.RESET}{title_color}{cls.Color.BOLD}{formatted}{cls.Color.RESET}{border_color}{cls.Style.VERTICAL}{cls.Color.RESET}")
-                else:
-                    formatted = f"{padding}{line}{padding}".ljust(internal_width)
-                    print(
-                        f"{border_color}{cls.Style.VERTICAL}{cls.Color.RESET}{text_color}{formatted}{cls.Color.RESET}{border_color}{cls.Style.VERTICAL}{cls.Color.RESET}")
-        print(bottom_border)
+                out.append(text_prefix + (padding + line).ljust(internal_width) + suffix)
+        out.append(bottom_border)
+        sys.stdout.write("\n".join(out) + "\n")
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _make_borders(cls, internal_width: int, border_color: str) -> Tuple[str, str, str]:
+        """Build the top, bottom and separator borders for a box of the given width."""
+        horizontal = cls.Style.HORIZONTAL * internal_width
+        top_border = f"{border_color}{cls.Style.TOP_LEFT}{horizontal}{cls.Style.TOP_RIGHT}{cls.Color.RESET}"
+        bottom_border = f"{border_color}{cls.Style.BOTTOM_LEFT}{horizontal}{cls.Style.BOTTOM_RIGHT}{cls.Color.RESET}"
+        separator = f"{border_color}{cls.Style.LEFT_T}{horizontal}{cls.Style.RIGHT_T}{cls.Color.RESET}"
+        return top_border, bottom_border, separator
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _style_prompt(cls, prompt: str, prompt_color: str) -> str:
+        """Wrap a prompt in its color codes; menus reuse the same few prompts."""
+        return f"{prompt_color}{cls.Color.BOLD}{prompt}{cls.Color.RESET}"
 
     @classmethod
     def get_input(cls, prompt: str = " > ", prompt_color: str = Color.GREEN) -> str:
         """Get user input with styled prompt and error handling."""
         try:
-            return input(f"{prompt_color}{cls.Color.BOLD}{prompt}{cls.Color.RESET}").strip().lower()
+            return input(cls._style_prompt(prompt, prompt_color)).strip().lower()
         except (EOFError, KeyboardInterrupt):
             print("\n")
             return "q"